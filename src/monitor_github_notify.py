@@ -1,13 +1,89 @@
 #!/usr/bin/env python3
 
-import json
+import copy
+import hashlib
+import logging
+import math
 import os
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
+import orjson
 import requests
-from github import Auth, Github
+from langdetect import PROFILES_DIRECTORY, DetectorFactory, LangDetectException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Debug logging and pretty-printed JSON output, enabled via MONITOR_DEBUG
+DEBUG = os.getenv("MONITOR_DEBUG", "").lower() in ("1", "true", "yes")
+JSON_OPTIONS = orjson.OPT_INDENT_2 if DEBUG else 0
+
+logger = logging.getLogger(__name__)
+
+# GitHub Search API endpoint
+SEARCH_ISSUES_URL = "https://api.github.com/search/issues"
+
+# GitHub Search API page size and result cap (search never returns more)
+SEARCH_PAGE_SIZE = 100
+SEARCH_RESULT_LIMIT = 1000
+
+# Number of search result pages fetched concurrently
+SEARCH_WORKERS = 4
+
+# How far before the newest issue already seen a search starts, so issues
+# indexed late or edited to match after creation are still found
+SEARCH_OVERLAP = timedelta(hours=1)
+
+# Longest wait for a GitHub rate limit to reset before giving up
+RATE_LIMIT_MAX_WAIT = 120
+
+# Webhook URL prefix for Slack incoming webhooks
+SLACK_WEBHOOK_PREFIX = "https://hooks.slack.com/"
+
+# Issue creation date format used in Slack messages
+SLACK_DATE_FORMAT = "%Y-%m-%d %H:%M UTC"
+
+# Quantized fastText language identification model (~900KB, vs ~125MB for
+# lid.176.bin); optional, detection falls back to langdetect without it
+FASTTEXT_MODEL_URL = (
+    "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz"
+)
+# SHA-256 of the model at FASTTEXT_MODEL_URL; other downloads are discarded
+FASTTEXT_MODEL_SHA256 = (
+    "8f3472cfe8738a7b6099e8e999c3cbfae0dcd15696aac7d7738a8039db603e83"
+)
+FASTTEXT_MODEL_PATH = Path("cache/lid.176.ftz")
+
+
+def _detection_sample(title: str, body: str) -> Optional[str]:
+    """Return the text to run language detection on, or None to skip it.
+
+    Detection is skipped for texts that are too short (< 20 chars), to avoid
+    false positives.
+    """
+    # Combine title and first 500 chars of body for language detection
+    # Limiting body length prevents spam URLs from overwhelming the
+    # actual content and causing false "English" detection
+    text = f"{title} {body[:500] if body else ''}"
+    if len(text.strip()) < 20:
+        return None
+    return text
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp with a UTC offset, or return None."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else None
 
 
 class GitHubIssueMonitor:
@@ -16,80 +92,225 @@ class GitHubIssueMonitor:
         github_token = os.getenv("GITHUB_TOKEN")
         if not github_token:
             raise ValueError("GITHUB_TOKEN environment variable is required")
-        auth = Auth.Token(github_token)
-        self.github = Github(auth=auth)
+        # Sent with GitHub API requests only, never to the Slack webhook
+        self._github_headers = {
+            "Authorization": f"token {github_token}",
+            "Accept": "application/vnd.github+json",
+        }
+        self._http = self._build_http_session()
         self.cache_file = Path(f"cache/{config['name']}-cache.json")
+        self._excluded_repos = frozenset(config.get("excludedRepos", []))
+        self._excluded_orgs = frozenset(config.get("excludedOrgs", []))
+        # The search date filter can reach up to a day past lookbackHours;
+        # notified issues are remembered for twice that window
+        search_window = config.get("lookbackHours", 24) + 24
+        self._notified_ttl = 2 * search_window * 3600
+        self._detector: Any = None
+        self._lang_factory: Optional[DetectorFactory] = None
+
+    @staticmethod
+    def _build_http_session() -> requests.Session:
+        """Build an HTTP session that reuses connections across requests."""
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            # Rate-limited 403s are handled in _fetch_search_page, since
+            # urllib3 would neither wait for the reset nor skip other 403s
+            status_forcelist=(429, 500, 502, 503, 504),
+            # Never replay POSTs: webhook posts are not idempotent
+            allowed_methods=frozenset({"GET"}),
+        )
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry),
+        )
+        # Slack posts run in a worker thread: only retry failed connections
+        # there, and never sleep on backoff
+        slack_retry = Retry(total=2, status=0, backoff_factor=0)
+        session.mount(
+            SLACK_WEBHOOK_PREFIX,
+            HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=slack_retry),
+        )
+        return session
+
+    def _load_language_model(self):
+        """Load the fastText language model, or None to use langdetect."""
+        try:
+            import fasttext
+
+            if not FASTTEXT_MODEL_PATH.exists():
+                self._download_language_model()
+            return fasttext.load_model(str(FASTTEXT_MODEL_PATH))
+        except Exception as e:
+            print(f"⚠️  fastText unavailable, falling back to langdetect: {e}")
+            return None
+
+    def _download_language_model(self):
+        """Download the fastText model into the cache directory."""
+        print(f"⬇️  Downloading fastText model to {FASTTEXT_MODEL_PATH}")
+        response = self._http.get(FASTTEXT_MODEL_URL, timeout=60)
+        response.raise_for_status()
+        digest = hashlib.sha256(response.content).hexdigest()
+        if digest != FASTTEXT_MODEL_SHA256:
+            raise ValueError(f"fastText model has unexpected SHA-256 {digest}")
+
+        # Write to a temporary file first so a failed download never leaves
+        # a truncated model behind
+        FASTTEXT_MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = FASTTEXT_MODEL_PATH.with_suffix(".tmp")
+        tmp_path.write_bytes(response.content)
+        tmp_path.replace(FASTTEXT_MODEL_PATH)
+
+    def _load_langdetect_factory(self) -> DetectorFactory:
+        """Load langdetect language profiles once for reuse across issues."""
+        factory = DetectorFactory()
+        factory.load_profile(PROFILES_DIRECTORY)
+        factory.set_seed(0)
+        return factory
 
     def load_cache(self) -> Dict[str, Any]:
         """Load cache file or return empty cache if not found."""
         try:
             if self.cache_file.exists():
-                with open(self.cache_file, "r") as f:
-                    return json.load(f)
+                with open(self.cache_file, "rb") as f:
+                    cache = orjson.loads(f.read())
+                # notified_issues maps issue IDs to their expiry timestamp;
+                # older caches stored a plain list of IDs
+                notified = cache.get("notified_issues", {})
+                if isinstance(notified, list):
+                    expiry = int(time.time()) + self._notified_ttl
+                    notified = {str(issue_id): expiry for issue_id in notified}
+                cache["notified_issues"] = notified
+                # A malformed watermark would break every search query
+                if _parse_timestamp(cache.get("last_seen_created_at")) is None:
+                    cache.pop("last_seen_created_at", None)
+                return cache
         except Exception as e:
             print(f"⚠️  Warning: Could not load cache: {e}")
-        return {"notified_issues": []}
+        return {"notified_issues": {}}
 
     def save_cache(self, cache: Dict[str, Any]):
         """Save cache to file."""
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w") as f:
-            json.dump(cache, f, indent=2)
+        with open(self.cache_file, "wb") as f:
+            f.write(orjson.dumps(cache, option=JSON_OPTIONS))
+
+    def build_search_query(self, since: Optional[str] = None) -> str:
+        """Build GitHub search query from configuration.
 
-    def build_search_query(self) -> str:
-        """Build GitHub search query from configuration."""
+        The search starts on the UTC date lookbackHours ago. If ``since``
+        (the ISO creation time of the newest issue already seen) is more
+        recent, it starts SEARCH_OVERLAP before ``since`` instead.
+        """
         # Combine search phrases with OR
         phrases = " OR ".join(f'"{phrase}"' for phrase in self.config["searchPhrases"])
-        query = f"({phrases}) type:issue"
+        parts = [f"({phrases}) type:issue"]
 
         # Add time filter for recent issues
         hours_ago = self.config.get("lookbackHours", 24)
-        date = (datetime.now() - timedelta(hours=hours_ago)).strftime("%Y-%m-%d")
-        query += f" created:>={date}"
+        # GitHub issue timestamps are UTC, so the cutoff must be as well
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+        cutoff = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+        start = datetime.fromisoformat(since) - SEARCH_OVERLAP if since else None
+        if start and start > cutoff:
+            parts.append(f"created:>={start:%Y-%m-%dT%H:%M:%SZ}")
+        else:
+            parts.append(f"created:>={cutoff:%Y-%m-%d}")
 
         # Automatically exclude the repository where this tool is deployed
         # This prevents the tool from detecting issues it creates in its own repo
         deployment_repo = os.getenv("GITHUB_REPOSITORY")
         if deployment_repo:
-            query += f" -repo:{deployment_repo}"
+            parts.append(f"-repo:{deployment_repo}")
             print(f"🚫 Auto-excluding deployment repository: {deployment_repo}")
 
         # Exclude repositories
-        if excluded_repos := self.config.get("excludedRepos", []):
-            excluded = " ".join(f"-repo:{repo}" for repo in excluded_repos)
-            query += f" {excluded}"
+        parts.extend(f"-repo:{repo}" for repo in self.config.get("excludedRepos", []))
 
         # Exclude organizations
-        if excluded_orgs := self.config.get("excludedOrgs", []):
-            excluded = " ".join(f"-org:{org}" for org in excluded_orgs)
-            query += f" {excluded}"
+        parts.extend(f"-org:{org}" for org in self.config.get("excludedOrgs", []))
+
+        return " ".join(parts)
+
+    @staticmethod
+    def _rate_limit_wait(response: requests.Response) -> Optional[float]:
+        """Return how long to wait before retrying a rate-limited response.
+
+        Returns None if the response is not a GitHub rate limit error.
+        """
+        if response.status_code != 403:
+            return None
+        # Secondary rate limits say how long to wait
+        if retry_after := response.headers.get("Retry-After"):
+            return float(retry_after)
+        # Primary rate limits report when the quota resets
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = int(response.headers.get("X-RateLimit-Reset", "0"))
+            return max(reset - time.time(), 0) + 1
+        return None
+
+    def _fetch_search_page(self, query: str, page: int) -> Dict[str, Any]:
+        """Fetch a single page of raw GitHub Search API results."""
+        params: Dict[str, Union[str, int]] = {
+            "q": query,
+            "sort": "created",
+            "order": "desc",
+            "per_page": SEARCH_PAGE_SIZE,
+            "page": page,
+        }
 
-        return query
+        def fetch() -> requests.Response:
+            return self._http.get(
+                SEARCH_ISSUES_URL,
+                params=params,
+                headers=self._github_headers,
+                timeout=15,
+            )
 
-    def search_issues(self) -> List[Dict[str, Any]]:
+        response = fetch()
+        wait = self._rate_limit_wait(response)
+        if wait is not None and wait <= RATE_LIMIT_MAX_WAIT:
+            print(f"⏳ GitHub rate limit reached, retrying in {wait:.0f}s")
+            time.sleep(wait)
+            response = fetch()
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def search_issues(self, since: Optional[str] = None) -> List[Dict[str, Any]]:
         """Search for issues using GitHub API."""
-        query = self.build_search_query()
+        query = self.build_search_query(since)
         print(f"🔍 Searching with query: {query}")
 
         try:
-            # Use GitHub Search API
-            issues = self.github.search_issues(query, sort="created", order="desc")
+            # Use GitHub Search API; the first page also reports the total
+            first_page = self._fetch_search_page(query, 1)
+
+            # Fetch the remaining result pages concurrently
+            total = min(first_page["total_count"], SEARCH_RESULT_LIMIT)
+            n_pages = math.ceil(total / SEARCH_PAGE_SIZE)
+            with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as pool:
+                pages = [first_page] + list(
+                    pool.map(
+                        lambda page: self._fetch_search_page(query, page),
+                        range(2, n_pages + 1),
+                    )
+                )
 
             # Convert to dict format and filter out PRs
-            results = []
-            for issue in issues:
-                if not hasattr(issue, "pull_request") or issue.pull_request is None:
-                    results.append(
-                        {
-                            "id": issue.id,
-                            "title": issue.title,
-                            "html_url": issue.html_url,
-                            "repository": issue.repository.full_name,
-                            "user": issue.user.login,
-                            "created_at": issue.created_at.isoformat(),
-                            "body": issue.body or "",
-                        }
-                    )
+            results = [
+                {
+                    "id": item["id"],
+                    "title": item["title"],
+                    "html_url": item["html_url"],
+                    "repository": "/".join(item["repository_url"].rsplit("/", 2)[-2:]),
+                    "user": item["user"]["login"],
+                    "created_at": item["created_at"],
+                    "body": item.get("body") or "",
+                }
+                for item in chain.from_iterable(page["items"] for page in pages)
+                if "pull_request" not in item
+            ]
 
             return results
 
@@ -100,84 +321,99 @@ class GitHubIssueMonitor:
     def is_excluded(self, issue: Dict[str, Any]) -> bool:
         """Check if issue should be excluded based on config."""
         repo = issue["repository"]
-        org = repo.split("/")[0]
-
-        if repo in self.config.get("excludedRepos", []):
-            return True
+        return (
+            repo in self._excluded_repos or repo.split("/", 1)[0] in self._excluded_orgs
+        )
 
-        if org in self.config.get("excludedOrgs", []):
-            return True
+    def detect_languages_bulk(self, issues: List[Dict[str, Any]]) -> Dict[int, str]:
+        """Detect the language of many issues in a single batch.
 
-        return False
+        Returns a mapping of issue ID to language code. Issues that are too
+        short or whose language could not be detected are left out, so
+        callers should treat missing IDs as English.
+        """
+        if not self.config.get("filterNonEnglish", False):
+            return {}
 
-    def is_non_english(self, issue: Dict[str, Any]) -> bool:
-        """Check if issue appears to be in a non-English language."""
-        import sys
+        # Short texts never reach the detector
+        samples = {}
+        for issue in issues:
+            text = _detection_sample(issue["title"], issue["body"])
+            if text is not None:
+                samples[issue["id"]] = text
 
-        # Debug: Log entry and config value
-        filter_enabled = self.config.get("filterNonEnglish", False)
-        print(
-            f"   [DEBUG] is_non_english called for: {issue['title'][:40]}...",
-            flush=True,
-        )
-        print(
-            f"   [DEBUG] filterNonEnglish={filter_enabled} "
-            f"(type={type(filter_enabled).__name__})",
-            flush=True,
-        )
+        if not samples:
+            return {}
 
-        # Only filter if language filtering is enabled
-        if not filter_enabled:
-            print("   [DEBUG] Language filtering disabled, returning False", flush=True)
-            return False
+        # Detectors are loaded on first use, so building a monitor does no I/O
+        if self._detector is None and self._lang_factory is None:
+            self._detector = self._load_language_model()
+            if self._detector is None:
+                self._lang_factory = self._load_langdetect_factory()
 
         try:
-            from langdetect import LangDetectException, detect
-
-            # Combine title and first 500 chars of body for language detection
-            # Limiting body length prevents spam URLs from overwhelming the
-            # actual content and causing false "English" detection
-            body_sample = issue["body"][:500] if issue["body"] else ""
-            text = f"{issue['title']} {body_sample}"
-            text_len = len(text.strip())
-            print(f"   [DEBUG] Text length (truncated): {text_len}", flush=True)
-
-            # Skip if text is too short (< 20 chars) to avoid false positives
-            if text_len < 20:
-                print("   [DEBUG] Text too short, skipping detection", flush=True)
-                return False
-
-            # Detect language
-            detected_lang = detect(text)
-            print(f"   [DEBUG] Detected language: {detected_lang}", flush=True)
-
-            # Return True if not English (langdetect uses 'en' for English)
-            if detected_lang != "en":
-                print(
-                    f"   🌐 Filtered non-English issue ({detected_lang}): "
-                    f"{issue['title'][:50]}...",
-                    flush=True,
-                )
-                return True
-            else:
-                print("   [DEBUG] Issue is English, not filtering", flush=True)
-
-        except LangDetectException:
-            # If detection fails, don't filter it out (benefit of doubt)
-            print(
-                f"   ⚠️  Could not detect language for: {issue['title'][:50]}...",
-                flush=True,
-            )
-            return False
+            if self._detector is not None:
+                return self._detect_fasttext(samples)
+            return self._detect_langdetect(samples)
         except Exception as e:
-            print(f"   ⚠️  Language detection error: {e}", flush=True)
-            import traceback
+            print(f"⚠️  Language detection error: {e}")
+            logger.debug("Language detection traceback", exc_info=True)
+            return {}
+
+    def _detect_fasttext(self, samples: Dict[int, str]) -> Dict[int, str]:
+        """Detect languages with a single batched fastText call."""
+        # fastText predicts one line per text
+        labels, _ = self._detector.predict(
+            [text.replace("\n", " ") for text in samples.values()], k=1
+        )
+        return {
+            issue_id: label[0].replace("__label__", "")
+            for issue_id, label in zip(samples, labels)
+        }
 
-            traceback.print_exc()
-            sys.stdout.flush()
-            return False
+    def _detect_langdetect(self, samples: Dict[int, str]) -> Dict[int, str]:
+        """Detect languages one text at a time with langdetect."""
+        if self._lang_factory is None:
+            return {}
+
+        langs = {}
+        for issue_id, text in samples.items():
+            detector = self._lang_factory.create()
+            detector.append(text)
+            try:
+                langs[issue_id] = detector.detect()
+            except LangDetectException:
+                # If detection fails, don't filter it out (benefit of doubt)
+                continue
+        return langs
+
+    @staticmethod
+    def _issue_block(issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the Slack section block for a single issue."""
+        repo_link = (
+            f"<https://github.com/{issue['repository']}" f"|{issue['repository']}>"
+        )
+        issue_link = f"<{issue['html_url']}|{issue['title']}>"
+        author_link = f"<https://github.com/{issue['user']}|@{issue['user']}>"
+        # fromisoformat() parses the trailing "Z" natively on Python 3.11+
+        created_date = datetime.fromisoformat(issue["created_at"]).strftime(
+            SLACK_DATE_FORMAT
+        )
 
-        return False
+        return {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*{issue_link}*\n📁 {repo_link} | "
+                + f"👤 {author_link} | 📅 {created_date}",
+            },
+            "accessory": {
+                "type": "button",
+                "text": {"type": "plain_text", "text": "View Issue"},
+                "url": issue["html_url"],
+                "action_id": f"view_issue_{issue['id']}",
+            },
+        }
 
     def send_slack_notification(self, issues: List[Dict[str, Any]]):
         """Send Slack notification with new issues."""
@@ -214,36 +450,12 @@ class GitHubIssueMonitor:
                 },
             },
             {"type": "divider"},
+        ] + [
+            # Add each issue as a block (limit to 10 for Slack limits)
+            self._issue_block(issue)
+            for issue in issues[:10]
         ]
 
-        # Add each issue as a block (limit to 10 for Slack limits)
-        for issue in issues[:10]:
-            repo_link = (
-                f"<https://github.com/{issue['repository']}" f"|{issue['repository']}>"
-            )
-            issue_link = f"<{issue['html_url']}|{issue['title']}>"
-            author_link = f"<https://github.com/{issue['user']}|@{issue['user']}>"
-            created_date = datetime.fromisoformat(
-                issue["created_at"].replace("Z", "+00:00")
-            ).strftime("%Y-%m-%d %H:%M UTC")
-
-            blocks.append(
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*{issue_link}*\n📁 {repo_link} | "
-                        + f"👤 {author_link} | 📅 {created_date}",
-                    },
-                    "accessory": {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "View Issue"},
-                        "url": issue["html_url"],
-                        "action_id": f"view_issue_{issue['id']}",
-                    },
-                }
-            )
-
         if len(issues) > 10:
             blocks.append(
                 {
@@ -268,7 +480,12 @@ class GitHubIssueMonitor:
             payload["channel"] = channel
 
         try:
-            response = requests.post(webhook_url, json=payload, timeout=10)
+            response = self._http.post(
+                webhook_url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=10,
+            )
             response.raise_for_status()
             print(f"✅ Slack notification sent for {count} issues")
         except requests.exceptions.RequestException as e:
@@ -277,8 +494,8 @@ class GitHubIssueMonitor:
     def save_new_issues(self, issues: List[Dict[str, Any]]):
         """Save new issues to JSON file for GitHub Actions to process."""
         if issues:
-            with open("new_issues.json", "w") as f:
-                json.dump(issues, f, indent=2)
+            with open("new_issues.json", "wb") as f:
+                f.write(orjson.dumps(issues, option=JSON_OPTIONS))
             print(f"💾 Saved {len(issues)} new issues to new_issues.json")
 
     def run(self):
@@ -288,50 +505,77 @@ class GitHubIssueMonitor:
 
             # Load cache and search for issues
             cache = self.load_cache()
-            issues = self.search_issues()
+
+            # Drop notified issues whose TTL has expired
+            now = int(time.time())
+            cache["notified_issues"] = {
+                issue_id: expiry
+                for issue_id, expiry in cache["notified_issues"].items()
+                if expiry > now
+            }
+
+            last_seen = cache.get("last_seen_created_at")
+            issues = self.search_issues(last_seen)
 
             print(f"📊 Found {len(issues)} total issues")
 
-            # Debug: Log config before filtering
-            print(
-                f"[DEBUG] Config filterNonEnglish: "
-                f"{self.config.get('filterNonEnglish', 'NOT SET')}",
-                flush=True,
+            # Remember the newest issue seen so the next search can start there
+            newest = max((issue["created_at"] for issue in issues), default=None)
+            seen_newer = newest is not None and (
+                last_seen is None or newest > last_seen
+            )
+            if seen_newer:
+                cache["last_seen_created_at"] = newest
+
+            logger.debug(
+                "Config filterNonEnglish: %s",
+                self.config.get("filterNonEnglish", "NOT SET"),
             )
-            print(f"[DEBUG] Starting to filter {len(issues)} issues...", flush=True)
 
             # Filter new issues
-            new_issues = [
+            notified = cache["notified_issues"]
+            candidates = [
                 issue
                 for issue in issues
-                if issue["id"] not in cache["notified_issues"]
-                and not self.is_excluded(issue)
-                and not self.is_non_english(issue)
+                if str(issue["id"]) not in notified and not self.is_excluded(issue)
+            ]
+
+            # Detect languages for all remaining candidates in one batch
+            langs = self.detect_languages_bulk(candidates)
+            new_issues = [
+                issue for issue in candidates if langs.get(issue["id"], "en") == "en"
             ]
+            if filtered := len(candidates) - len(new_issues):
+                print(f"🌐 Filtered {filtered} non-English issues")
 
             print(f"🆕 {len(new_issues)} new issues to notify about")
 
             if new_issues:
-                # Send notifications
-                self.send_slack_notification(new_issues)
+                # Send notifications in the background so saving results
+                # doesn't wait on the Slack round-trip
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    slack_future = pool.submit(self.send_slack_notification, new_issues)
+
+                    # Save new issues for GitHub Actions to process
+                    # (GitHub Issues)
+                    github_issues_config = self.config.get("notifications", {}).get(
+                        "githubIssues", {}
+                    )
+                    if github_issues_config.get(
+                        "enabled", True
+                    ):  # Default to enabled for backward compatibility
+                        self.save_new_issues(new_issues)
 
-                # Save new issues for GitHub Actions to process
-                # (GitHub Issues)
-                github_issues_config = self.config.get("notifications", {}).get(
-                    "githubIssues", {}
-                )
-                if github_issues_config.get(
-                    "enabled", True
-                ):  # Default to enabled for backward compatibility
-                    self.save_new_issues(new_issues)
+                    # Update cache
+                    expiry = now + self._notified_ttl
+                    notified.update((str(issue["id"]), expiry) for issue in new_issues)
 
-                # Update cache
-                cache["notified_issues"].extend(issue["id"] for issue in new_issues)
+                    self.save_cache(cache)
 
-                # Keep cache size manageable
-                if len(cache["notified_issues"]) > 1000:
-                    cache["notified_issues"] = cache["notified_issues"][-1000:]
+                # Re-raise any unexpected error from the Slack worker
+                slack_future.result()
 
+            elif seen_newer:
                 self.save_cache(cache)
 
             print("✅ Monitor run completed successfully")
@@ -341,13 +585,32 @@ class GitHubIssueMonitor:
             raise
 
 
+@lru_cache(maxsize=1)
+def _parse_config(config_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file; the mtime is only part of the cache key."""
+    with open(config_file, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def load_config(config_file: str) -> Dict[str, Any]:
+    """Load a config file, reusing the parsed result until it changes.
+
+    Each caller gets its own copy, so mutating it never touches the cache.
+    """
+    config = _parse_config(config_file, os.stat(config_file).st_mtime_ns)
+    return copy.deepcopy(config)
+
+
 def main():
     """Main entry point."""
     config_file = os.getenv("CONFIG_FILE", "configs/template.json.example")
+    logging.basicConfig(
+        level=logging.DEBUG if DEBUG else logging.INFO,
+        format="[%(levelname)s] %(message)s",
+    )
 
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
+        config = load_config(config_file)
 
         monitor = GitHubIssueMonitor(config)
         monitor.run()
@@ -355,7 +618,7 @@ def main():
     except FileNotFoundError:
         print(f"❌ Config file not found: {config_file}")
         exit(1)
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ Invalid JSON in config file: {e}")
         exit(1)
     except Exception as e:
@@ -1,8 +1,9 @@
 """Pytest configuration and shared fixtures."""
 
+import json
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 import pytest
 
@@ -70,15 +71,24 @@ def temp_cache_dir():
 
 
 @pytest.fixture
-def mock_github_issue():
-    """Mock GitHub issue object for testing."""
-    issue = Mock()
-    issue.id = 12345
-    issue.title = "Test Issue"
-    issue.html_url = "https://github.com/test/repo/issues/1"
-    issue.repository.full_name = "test/repo"
-    issue.user.login = "testuser"
-    issue.created_at.isoformat.return_value = "2024-01-15T14:30:00Z"
-    issue.body = "Test issue body"
-    issue.pull_request = None
-    return issue
+def github_search_item():
+    """Raw GitHub Search API issue item for testing."""
+    return {
+        "id": 12345,
+        "title": "Test Issue",
+        "html_url": "https://github.com/test/repo/issues/1",
+        "repository_url": "https://api.github.com/repos/test/repo",
+        "user": {"login": "testuser"},
+        "created_at": "2024-01-15T14:30:00Z",
+        "body": "Test issue body",
+    }
+
+
+def _search_response(*items, total_count=None):
+    """Mock a GitHub Search API response holding a single page of items."""
+    if total_count is None:
+        total_count = len(items)
+    content = json.dumps({"total_count": total_count, "items": list(items)})
+    return SimpleNamespace(
+        status_code=200, content=content.encode(), raise_for_status=lambda: None
+    )
@@ -5,32 +5,53 @@
 import json
 import os
 import tempfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from src.monitor_github_notify import GitHubIssueMonitor, main
+from src import monitor_github_notify
+from src.monitor_github_notify import GitHubIssueMonitor, load_config, main
+from tests.conftest import _search_response
 
 
+def _predict_cyrillic_as_russian(texts, k=1):
+    """Stand-in for fastText predict(): Cyrillic text is Russian, rest English."""
+    labels = []
+    for text in texts:
+        russian = any("а" <= char <= "я" for char in text.lower())
+        labels.append(("__label__ru",) if russian else ("__label__en",))
+    return labels, [(0.99,)] * len(texts)
+
+
+@pytest.fixture(autouse=True)
+def _run_in_tmp_path(tmp_path, monkeypatch):
+    """Run each test from a temporary directory.
+
+    run() writes new_issues.json into the working directory.
+    """
+    monkeypatch.chdir(tmp_path)
+
+
+@patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"})
 class TestIntegration:
     """Integration tests for the complete monitoring workflow."""
 
-    @patch("src.monitor_github_notify.Github")
-    @patch("src.monitor_github_notify.requests.post")
+    @patch("src.monitor_github_notify.requests.Session.get")
+    @patch("src.monitor_github_notify.requests.Session.post")
     def test_complete_monitoring_workflow(
         self,
         mock_post,
-        mock_github_class,
+        mock_get,
         sample_config,
         sample_issues,
-        mock_github_token,
     ):
         """Test the complete monitoring workflow from search to notification."""
         # Setup mocks
-        mock_github = Mock()
-        mock_github.search_issues.return_value = []  # No issues found initially
-        mock_github_class.return_value = mock_github
+        # No issues found initially
+        mock_get.return_value = _search_response()
 
         # Mock successful Slack response
         mock_post.return_value.raise_for_status.return_value = None
@@ -47,17 +68,17 @@ class TestIntegration:
             # For the first run with no issues, cache file won't exist yet
 
             # Second run - with new issues
-            mock_issue1 = Mock()
-            mock_issue1.id = 12345
-            mock_issue1.title = "Security vulnerability"
-            mock_issue1.html_url = "https://github.com/test/repo/issues/1"
-            mock_issue1.repository.full_name = "test/repo"
-            mock_issue1.user.login = "reporter"
-            mock_issue1.created_at.isoformat.return_value = "2024-01-15T14:30:00Z"
-            mock_issue1.body = "Critical security issue"
-            mock_issue1.pull_request = None
-
-            mock_github.search_issues.return_value = [mock_issue1]
+            issue_item1 = {
+                "id": 12345,
+                "title": "Security vulnerability",
+                "html_url": "https://github.com/test/repo/issues/1",
+                "repository_url": "https://api.github.com/repos/test/repo",
+                "user": {"login": "reporter"},
+                "created_at": "2024-01-15T14:30:00Z",
+                "body": "Critical security issue",
+            }
+
+            mock_get.return_value = _search_response(issue_item1)
 
             # Run without mocking file operations so cache can be saved
             monitor.run()
@@ -68,7 +89,8 @@ class TestIntegration:
             # Verify cache was updated (after processing new issues)
             assert monitor.cache_file.exists()
             cache_data = json.loads(monitor.cache_file.read_text())
-            assert 12345 in cache_data["notified_issues"]
+            assert "12345" in cache_data["notified_issues"]
+            assert cache_data["last_seen_created_at"] == "2024-01-15T14:30:00Z"
 
     def test_main_function_with_config_file(self, sample_config):
         """Test the main function with a configuration file."""
@@ -77,21 +99,39 @@ class TestIntegration:
             config_file = f.name
 
         try:
-            with patch.dict(
-                os.environ, {"CONFIG_FILE": config_file, "GITHUB_TOKEN": "fake_token"}
-            ), patch("src.monitor_github_notify.GitHubIssueMonitor.run") as mock_run:
+            with patch.dict(os.environ, {"CONFIG_FILE": config_file}), patch(
+                "src.monitor_github_notify.GitHubIssueMonitor.run"
+            ) as mock_run:
 
                 main()
                 mock_run.assert_called_once()
         finally:
             os.unlink(config_file)
 
+    def test_load_config_cached_until_modified(self, temp_cache_dir):
+        """Test that the parsed config is reused until the file changes."""
+        config_file = temp_cache_dir / "monitor.json"
+        config_file.write_text('{"name": "first"}')
+
+        first = load_config(str(config_file))
+        first["name"] = "mutated"
+        hits = monitor_github_notify._parse_config.cache_info().hits
+
+        # Served from the cache, unaffected by the caller's mutation
+        assert load_config(str(config_file))["name"] == "first"
+        assert monitor_github_notify._parse_config.cache_info().hits == hits + 1
+
+        config_file.write_text('{"name": "second"}')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert load_config(str(config_file))["name"] == "second"
+
     def test_main_function_missing_config(self):
         """Test main function behavior with missing config file."""
-        with patch.dict(
-            os.environ,
-            {"CONFIG_FILE": "nonexistent.json", "GITHUB_TOKEN": "fake_token"},
-        ), pytest.raises(SystemExit) as exc_info:
+        with patch.dict(os.environ, {"CONFIG_FILE": "nonexistent.json"}), pytest.raises(
+            SystemExit
+        ) as exc_info:
             main()
 
         assert exc_info.value.code == 1
@@ -103,31 +143,27 @@ class TestIntegration:
             config_file = f.name
 
         try:
-            with patch.dict(
-                os.environ, {"CONFIG_FILE": config_file, "GITHUB_TOKEN": "fake_token"}
-            ), pytest.raises(SystemExit) as exc_info:
+            with patch.dict(os.environ, {"CONFIG_FILE": config_file}), pytest.raises(
+                SystemExit
+            ) as exc_info:
                 main()
 
             assert exc_info.value.code == 1
         finally:
             os.unlink(config_file)
 
-    @patch("src.monitor_github_notify.Github")
-    def test_no_new_issues_workflow(
-        self, mock_github_class, sample_config, mock_github_token
-    ):
+    @patch("src.monitor_github_notify.requests.Session.get")
+    def test_no_new_issues_workflow(self, mock_get, sample_config):
         """Test workflow when no new issues are found."""
-        mock_github = Mock()
-        mock_github.search_issues.return_value = []
-        mock_github_class.return_value = mock_github
+        mock_get.return_value = _search_response()
 
         with tempfile.TemporaryDirectory() as tmpdir:
             monitor = GitHubIssueMonitor(sample_config)
             monitor.cache_file = Path(tmpdir) / "test-cache.json"
 
-            with patch("src.monitor_github_notify.requests.post") as mock_post, patch(
-                "builtins.open", create=True
-            ) as mock_open:
+            with patch(
+                "src.monitor_github_notify.requests.Session.post"
+            ) as mock_post, patch("builtins.open", create=True) as mock_open:
 
                 monitor.run()
 
@@ -139,79 +175,190 @@ class TestIntegration:
                     "new_issues.json" in str(call) for call in mock_open.call_args_list
                 )
 
-    @patch("src.monitor_github_notify.Github")
-    def test_duplicate_issue_filtering(
-        self, mock_github_class, sample_config, mock_github_token
-    ):
+    @patch("src.monitor_github_notify.requests.Session.get")
+    def test_duplicate_issue_filtering(self, mock_get, sample_config):
         """Test that duplicate issues are properly filtered out."""
-        mock_github = Mock()
-
-        # Create mock issue
-        mock_issue = Mock()
-        mock_issue.id = 12345
-        mock_issue.title = "Test Issue"
-        mock_issue.html_url = "https://github.com/test/repo/issues/1"
-        mock_issue.repository.full_name = "test/repo"
-        mock_issue.user.login = "reporter"
-        mock_issue.created_at.isoformat.return_value = "2024-01-15T14:30:00Z"
-        mock_issue.body = "Test body"
-        mock_issue.pull_request = None
-
-        mock_github.search_issues.return_value = [mock_issue]
-        mock_github_class.return_value = mock_github
+        # Raw GitHub Search API issue item
+        issue_item = {
+            "id": 12345,
+            "title": "Test Issue",
+            "html_url": "https://github.com/test/repo/issues/1",
+            "repository_url": "https://api.github.com/repos/test/repo",
+            "user": {"login": "reporter"},
+            "created_at": "2024-01-15T14:30:00Z",
+            "body": "Test body",
+        }
+
+        mock_get.return_value = _search_response(issue_item)
 
         with tempfile.TemporaryDirectory() as tmpdir:
             monitor = GitHubIssueMonitor(sample_config)
             monitor.cache_file = Path(tmpdir) / "test-cache.json"
 
             # First run - issue should be processed
-            with patch("src.monitor_github_notify.requests.post") as mock_post:
+            with patch("src.monitor_github_notify.requests.Session.post") as mock_post:
                 monitor.run()
                 mock_post.assert_called_once()
 
             # Second run - same issue should be filtered out
-            with patch("src.monitor_github_notify.requests.post") as mock_post:
+            with patch("src.monitor_github_notify.requests.Session.post") as mock_post:
                 monitor.run()
                 mock_post.assert_not_called()
 
+    @patch("src.monitor_github_notify.requests.Session.get")
+    def test_next_search_starts_from_newest_issue(
+        self, mock_get, sample_config, github_search_item
+    ):
+        """Test that a second run searches from just before the newest issue."""
+        created = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=2)
+        issue_item = {
+            **github_search_item,
+            "created_at": f"{created:%Y-%m-%dT%H:%M:%SZ}",
+        }
+        mock_get.return_value = _search_response(issue_item)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monitor = GitHubIssueMonitor(sample_config)
+            monitor.cache_file = Path(tmpdir) / "test-cache.json"
+
+            with patch("src.monitor_github_notify.requests.Session.post"):
+                monitor.run()
+                monitor.run()
 
+        first, second = (call[1]["params"]["q"] for call in mock_get.call_args_list)
+        start = created - monitor_github_notify.SEARCH_OVERLAP
+        assert f"created:>={start:%Y-%m-%dT%H:%M:%SZ}" not in first
+        assert f"created:>={start:%Y-%m-%dT%H:%M:%SZ}" in second
+
+    @patch("src.monitor_github_notify.requests.Session.get")
+    def test_watermark_saved_without_new_issues(
+        self, mock_get, sample_config, github_search_item
+    ):
+        """Test that a newer issue that isn't notified still moves the watermark."""
+        excluded_item = {
+            **github_search_item,
+            "id": 67890,
+            "repository_url": "https://api.github.com/repos/spam/repo",
+            "created_at": "2024-01-15T16:00:00Z",
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monitor = GitHubIssueMonitor(sample_config)
+            monitor.cache_file = Path(tmpdir) / "test-cache.json"
+
+            mock_get.return_value = _search_response(github_search_item)
+            with patch("src.monitor_github_notify.requests.Session.post"):
+                monitor.run()
+
+            # Only an already notified issue and an excluded repository's issue
+            mock_get.return_value = _search_response(github_search_item, excluded_item)
+            with patch("src.monitor_github_notify.requests.Session.post") as mock_post:
+                monitor.run()
+                mock_post.assert_not_called()
+
+            cache_data = json.loads(monitor.cache_file.read_text())
+            assert cache_data["last_seen_created_at"] == "2024-01-15T16:00:00Z"
+            assert list(cache_data["notified_issues"]) == ["12345"]
+
+    @patch("src.monitor_github_notify.requests.Session.get")
+    @patch("src.monitor_github_notify.requests.Session.post")
+    def test_non_english_issues_not_notified(
+        self, mock_post, mock_get, sample_config, github_search_item, tmp_path
+    ):
+        """Test that run() drops issues detected as non-English."""
+        russian_item = {
+            **github_search_item,
+            "id": 111,
+            "title": "Проблема с безопасностью",
+            "html_url": "https://github.com/test/repo/issues/2",
+            "body": "Подробное описание проблемы безопасности.",
+        }
+        mock_get.return_value = _search_response(github_search_item, russian_item)
+        detector = SimpleNamespace(predict=_predict_cyrillic_as_russian)
+        config = {**sample_config, "filterNonEnglish": True}
+
+        with patch.object(
+            GitHubIssueMonitor, "_load_language_model", return_value=detector
+        ):
+            monitor = GitHubIssueMonitor(config)
+            monitor.cache_file = tmp_path / "test-cache.json"
+            monitor.run()
+
+        slack_payload = json.loads(mock_post.call_args[1]["data"])
+        slack_urls = [
+            block["accessory"]["url"]
+            for block in slack_payload["blocks"]
+            if "accessory" in block
+        ]
+        assert slack_urls == [github_search_item["html_url"]]
+
+        saved = json.loads((tmp_path / "new_issues.json").read_text())
+        assert [issue["id"] for issue in saved] == [12345]
+
+    @patch("src.monitor_github_notify.requests.Session.get")
+    def test_expired_issue_notified_again(self, mock_get, sample_config):
+        """Test that cached issues are forgotten once their TTL expires."""
+        issue_item = {
+            "id": 12345,
+            "title": "Test Issue",
+            "html_url": "https://github.com/test/repo/issues/1",
+            "repository_url": "https://api.github.com/repos/test/repo",
+            "user": {"login": "reporter"},
+            "created_at": "2024-01-15T14:30:00Z",
+            "body": "Test body",
+        }
+        mock_get.return_value = _search_response(issue_item)
+        now = 1705330000
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monitor = GitHubIssueMonitor(sample_config)
+            monitor.cache_file = Path(tmpdir) / "test-cache.json"
+
+            with patch("src.monitor_github_notify.requests.Session.post"), patch(
+                "src.monitor_github_notify.time.time", return_value=now
+            ):
+                monitor.run()
+
+            # TTL is twice the 24 hour lookback window plus a day
+            with patch(
+                "src.monitor_github_notify.requests.Session.post"
+            ) as mock_post, patch(
+                "src.monitor_github_notify.time.time", return_value=now + 97 * 3600
+            ):
+                monitor.run()
+                mock_post.assert_called_once()
+
+
+@patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"})
 class TestErrorHandling:
     """Test error handling scenarios."""
 
-    @patch("src.monitor_github_notify.Github")
-    def test_github_api_error_handling(
-        self, mock_github_class, sample_config, mock_github_token
-    ):
+    @patch("src.monitor_github_notify.requests.Session.get")
+    def test_github_api_error_handling(self, mock_get, sample_config):
         """Test handling of GitHub API errors."""
-        mock_github = Mock()
-        mock_github.search_issues.side_effect = Exception("GitHub API Error")
-        mock_github_class.return_value = mock_github
+        mock_get.side_effect = Exception("GitHub API Error")
 
         monitor = GitHubIssueMonitor(sample_config)
 
         with pytest.raises(Exception, match="GitHub API Error"):
             monitor.run()
 
-    @patch("src.monitor_github_notify.Github")
-    @patch("src.monitor_github_notify.requests.post")
-    def test_slack_error_handling(
-        self, mock_post, mock_github_class, sample_config, mock_github_token
-    ):
+    @patch("src.monitor_github_notify.requests.Session.get")
+    @patch("src.monitor_github_notify.requests.Session.post")
+    def test_slack_error_handling(self, mock_post, mock_get, sample_config):
         """Test handling of Slack notification errors."""
         # Setup GitHub mock
-        mock_github = Mock()
-        mock_issue = Mock()
-        mock_issue.id = 12345
-        mock_issue.title = "Test Issue"
-        mock_issue.html_url = "https://github.com/test/repo/issues/1"
-        mock_issue.repository.full_name = "test/repo"
-        mock_issue.user.login = "reporter"
-        mock_issue.created_at.isoformat.return_value = "2024-01-15T14:30:00Z"
-        mock_issue.body = "Test body"
-        mock_issue.pull_request = None
-
-        mock_github.search_issues.return_value = [mock_issue]
-        mock_github_class.return_value = mock_github
+        issue_item = {
+            "id": 12345,
+            "title": "Test Issue",
+            "html_url": "https://github.com/test/repo/issues/1",
+            "repository_url": "https://api.github.com/repos/test/repo",
+            "user": {"login": "reporter"},
+            "created_at": "2024-01-15T14:30:00Z",
+            "body": "Test body",
+        }
+
+        mock_get.return_value = _search_response(issue_item)
 
         # Slack error
         mock_post.side_effect = Exception("Slack error")
@@ -223,7 +370,7 @@ class TestErrorHandling:
             with pytest.raises(Exception, match="Slack error"):
                 monitor.run()
 
-    def test_cache_permission_error(self, sample_config, mock_github_token):
+    def test_cache_permission_error(self, sample_config):
         """Test handling of cache file permission errors."""
         monitor = GitHubIssueMonitor(sample_config)
 
@@ -1,477 +1,692 @@
 #!/usr/bin/env python3
 
+import copy
+import hashlib
+import io
 import json
 import os
-import unittest
-from datetime import datetime
-from unittest.mock import Mock, mock_open, patch
-
+import tempfile
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import MagicMock, Mock, mock_open, patch
+
+import pytest
 import requests
 
-from src.monitor_github_notify import GitHubIssueMonitor
-
-
-class TestGitHubIssueMonitor(unittest.TestCase):
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_config = {
-            "name": "test-monitor",
-            "searchPhrases": ["security vulnerability", "critical bug"],
-            "excludedRepos": ["spam/repo", "test/exclude"],
-            "excludedOrgs": ["spamorg", "excludeorg"],
-            "lookbackHours": 24,
-            "notifications": {
-                "githubIssues": {"enabled": True},
-                "slack": {
-                    "enabled": True,
-                    "channel": "#test-alerts",
-                    "webhookUrl": "https://hooks.slack.com/test",
-                },
+from src.monitor_github_notify import GitHubIssueMonitor, _detection_sample
+from tests.conftest import _search_response
+
+_TEST_CONFIG = MappingProxyType(
+    {
+        "name": "test-monitor",
+        "searchPhrases": ["security vulnerability", "critical bug"],
+        "excludedRepos": ["spam/repo", "test/exclude"],
+        "excludedOrgs": ["spamorg", "excludeorg"],
+        "lookbackHours": 24,
+        "notifications": {
+            "githubIssues": {"enabled": True},
+            "slack": {
+                "enabled": True,
+                "channel": "#test-alerts",
+                "webhookUrl": "https://hooks.slack.com/test",
             },
+        },
+    }
+)
+
+_SAMPLE_ISSUES = (
+    MappingProxyType(
+        {
+            "id": 12345,
+            "title": "Critical security vulnerability found",
+            "html_url": "https://github.com/owner/repo/issues/123",
+            "repository": "owner/repo",
+            "user": "reporter1",
+            "created_at": "2024-01-15T14:30:00Z",
+            "body": "This is a detailed description of the security issue...",
+        }
+    ),
+    MappingProxyType(
+        {
+            "id": 67890,
+            "title": "Another critical bug",
+            "html_url": "https://github.com/another/repo/issues/456",
+            "repository": "another/repo",
+            "user": "reporter2",
+            "created_at": "2024-01-15T15:45:00Z",
+            "body": "Bug description here",
+        }
+    ),
+)
+
+_NON_ENGLISH_ISSUES = (
+    MappingProxyType(
+        {
+            "id": 111,
+            "title": "Проблема с безопасностью",
+            "body": "Подробное описание проблемы безопасности.",
+        }
+    ),
+    MappingProxyType(
+        {
+            "id": 222,
+            "title": "Problème de sécurité critique",
+            "body": "Ceci est une description détaillée du problème de sécurité.",
         }
+    ),
+)
 
-        self.sample_issues = [
-            {
-                "id": 12345,
-                "title": "Critical security vulnerability found",
-                "html_url": "https://github.com/owner/repo/issues/123",
-                "repository": "owner/repo",
-                "user": "reporter1",
-                "created_at": "2024-01-15T14:30:00Z",
-                "body": "This is a detailed description of the security issue...",
-            },
-            {
-                "id": 67890,
-                "title": "Another critical bug",
-                "html_url": "https://github.com/another/repo/issues/456",
-                "repository": "another/repo",
-                "user": "reporter2",
-                "created_at": "2024-01-15T15:45:00Z",
-                "body": "Bug description here",
-            },
-        ]
-
-    @patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"})
-    def test_init(self):
-        """Test monitor initialization."""
-        monitor = GitHubIssueMonitor(self.test_config)
-
-        self.assertEqual(monitor.config, self.test_config)
-        self.assertTrue(monitor.cache_file.name.endswith("test-monitor-cache.json"))
-        self.assertIsNotNone(monitor.github)
-
-    def test_build_search_query_basic(self):
-        """Test basic search query construction."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
-
-        with patch("src.monitor_github_notify.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 15, 12, 0, 0)
-            query = monitor.build_search_query()
-
-        expected_phrases = '("security vulnerability" OR "critical bug")'
-        self.assertIn(expected_phrases, query)
-        self.assertIn("type:issue", query)
-        self.assertIn("created:>=2024-01-14", query)  # 24 hours ago
-
-    def test_build_search_query_with_exclusions(self):
-        """Test search query with repository and organization exclusions."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
-
-        with patch("src.monitor_github_notify.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 15, 12, 0, 0)
-            query = monitor.build_search_query()
-
-        self.assertIn("-repo:spam/repo", query)
-        self.assertIn("-repo:test/exclude", query)
-        self.assertIn("-org:spamorg", query)
-        self.assertIn("-org:excludeorg", query)
-
-    def test_build_search_query_custom_lookback(self):
-        """Test search query with custom lookback hours."""
-        config = self.test_config.copy()
-        config["lookbackHours"] = 48
-
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(config)
+# Cache file contents as read from disk, serialized once at import time
+_CACHE_JSON = b'{"notified_issues": {"123": 1705330000, "456": 1705340000}}'
+_CACHE_OBJ = json.loads(_CACHE_JSON)
+_LEGACY_CACHE_JSON = b'{"notified_issues": [123, 456]}'
 
-        with patch("src.monitor_github_notify.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 15, 12, 0, 0)
-            query = monitor.build_search_query()
 
-        self.assertIn("created:>=2024-01-13", query)  # 48 hours ago
+def _merged(base, overrides):
+    """Return a copy of ``base`` with ``overrides`` merged into nested dicts."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), Mapping):
+            value = _merged(merged[key], value)
+        merged[key] = value
+    return merged
 
-    def test_is_excluded_repo(self):
-        """Test repository exclusion logic."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
 
-        # Test excluded repo
-        excluded_issue = {"repository": "spam/repo"}
-        self.assertTrue(monitor.is_excluded(excluded_issue))
+def _fake_open(buf):
+    """Mock ``open`` so that anything written lands in ``buf``."""
+    mock_file = MagicMock()
+    mock_file.return_value.__enter__.return_value = buf
+    return mock_file
 
-        # Test non-excluded repo
-        normal_issue = {"repository": "normal/repo"}
-        self.assertFalse(monitor.is_excluded(normal_issue))
 
-    def test_is_excluded_org(self):
-        """Test organization exclusion logic."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
+@pytest.fixture(scope="module")
+def _monitor():
+    """Monitor built once per module from the test config."""
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
+        return GitHubIssueMonitor(_TEST_CONFIG)
 
-        # Test excluded org
-        excluded_issue = {"repository": "spamorg/somerepo"}
-        self.assertTrue(monitor.is_excluded(excluded_issue))
 
-        # Test non-excluded org
-        normal_issue = {"repository": "normalorg/repo"}
-        self.assertFalse(monitor.is_excluded(normal_issue))
+@pytest.fixture(scope="module")
+def _filter_monitor():
+    """Monitor built once per module with non-English filtering enabled."""
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
+        monitor = GitHubIssueMonitor({**_TEST_CONFIG, "filterNonEnglish": True})
+    # Load langdetect up front so tests never load or download a fastText model
+    monitor._lang_factory = monitor._load_langdetect_factory()
+    return monitor
 
-    def test_is_non_english_disabled(self):
-        """Test language filtering when disabled (default)."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
 
-        # When filterNonEnglish is not enabled, should always return False
-        french_issue = {
-            "title": "Problème de sécurité critique",
-            "body": "Ceci est une description détaillée du problème de sécurité.",
-        }
-        self.assertFalse(monitor.is_non_english(french_issue))
+@pytest.fixture
+def monitor(_monitor):
+    """Per-test copy of the shared test config monitor."""
+    # A shallow copy keeps per-test attribute changes off the shared monitor
+    return copy.copy(_monitor)
 
-    @patch("langdetect.detect")
-    def test_is_non_english_english_issue(self, mock_detect):
-        """Test that English issues are not filtered."""
-        config = self.test_config.copy()
-        config["filterNonEnglish"] = True
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(config)
+@pytest.fixture
+def filter_monitor(_filter_monitor):
+    """Per-test copy of the shared filtering monitor."""
+    return copy.copy(_filter_monitor)
 
-        mock_detect.return_value = "en"
 
-        english_issue = {
-            "title": "Critical security vulnerability found",
-            "body": "This is a detailed description of the security issue.",
-        }
+@pytest.fixture
+def monitor_slack_disabled(mock_github_token):
+    """Monitor with Slack notifications turned off."""
+    config = _merged(_TEST_CONFIG, {"notifications": {"slack": {"enabled": False}}})
+    return GitHubIssueMonitor(config)
 
-        self.assertFalse(monitor.is_non_english(english_issue))
-        mock_detect.assert_called_once()
 
-    @patch("langdetect.detect")
-    def test_is_non_english_non_english_issue(self, mock_detect):
-        """Test that non-English issues are filtered."""
-        config = self.test_config.copy()
-        config["filterNonEnglish"] = True
+@pytest.fixture
+def frozen_now():
+    """Pin ``datetime.now()`` in the monitor to 2024-01-15 12:00 UTC."""
+    with patch("src.monitor_github_notify.datetime", wraps=datetime) as mock_datetime:
+        mock_datetime.now.return_value = datetime(2024, 1, 15, 12, tzinfo=timezone.utc)
+        yield mock_datetime
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(config)
 
-        # Test French issue
-        mock_detect.return_value = "fr"
+def test_init(monitor):
+    """Test monitor initialization."""
+    assert monitor.config == _TEST_CONFIG
+    assert monitor.cache_file.name.endswith("test-monitor-cache.json")
+    assert isinstance(monitor._http, requests.Session)
 
-        french_issue = {
-            "title": "Problème de sécurité critique",
-            "body": "Ceci est une description détaillée du problème de sécurité.",
-        }
 
-        self.assertTrue(monitor.is_non_english(french_issue))
-        mock_detect.assert_called_once()
+def test_http_session_never_retries_post(monitor):
+    """Test that webhook posts outside hooks.slack.com are not replayed."""
+    adapter = monitor._http.get_adapter("https://hooks.slack-gov.com/services/x")
 
-    @patch("langdetect.detect")
-    def test_is_non_english_short_text(self, mock_detect):
-        """Test that very short text is not filtered to avoid false positives."""
-        config = self.test_config.copy()
-        config["filterNonEnglish"] = True
+    assert not adapter.max_retries.is_retry("POST", 503)
+    assert adapter.max_retries.is_retry("GET", 503)
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(config)
 
-        short_issue = {"title": "Bug", "body": ""}
+def test_is_excluded_repo(monitor):
+    """Test repository exclusion logic."""
+    # Test excluded repo
+    excluded_issue = {"repository": "spam/repo"}
+    assert monitor.is_excluded(excluded_issue)
 
-        self.assertFalse(monitor.is_non_english(short_issue))
-        # detect should not be called for short text
-        mock_detect.assert_not_called()
+    # Test non-excluded repo
+    normal_issue = {"repository": "normal/repo"}
+    assert not monitor.is_excluded(normal_issue)
 
-    @patch("langdetect.detect")
-    def test_is_non_english_detection_exception(self, mock_detect):
-        """Test handling of language detection exceptions."""
-        from langdetect import LangDetectException
 
-        config = self.test_config.copy()
-        config["filterNonEnglish"] = True
+def test_is_excluded_org(monitor):
+    """Test organization exclusion logic."""
+    # Test excluded org
+    excluded_issue = {"repository": "spamorg/somerepo"}
+    assert monitor.is_excluded(excluded_issue)
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(config)
+    # Test non-excluded org
+    normal_issue = {"repository": "normalorg/repo"}
+    assert not monitor.is_excluded(normal_issue)
 
-        # Simulate LangDetectException
-        mock_detect.side_effect = LangDetectException("code", "message")
 
-        issue = {
-            "title": "Some issue title with enough text",
-            "body": "Issue body with more text to trigger detection",
-        }
+@patch("src.monitor_github_notify.DetectorFactory.create")
+def test_detect_languages_english_issue(mock_create, filter_monitor):
+    """Test that English issues are detected as English."""
+    mock_create.return_value.detect.return_value = "en"
 
-        # Should not filter when detection fails
-        self.assertFalse(monitor.is_non_english(issue))
+    english_issue = {
+        "id": 1,
+        "title": "Critical security vulnerability found",
+        "body": "This is a detailed description of the security issue.",
+    }
 
-    @patch("langdetect.detect")
-    def test_is_non_english_generic_exception(self, mock_detect):
-        """Test handling of generic exceptions in language detection."""
-        config = self.test_config.copy()
-        config["filterNonEnglish"] = True
+    assert filter_monitor.detect_languages_bulk([english_issue]) == {1: "en"}
+    mock_create.return_value.detect.assert_called_once()
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(config)
 
-        # Simulate generic exception
-        mock_detect.side_effect = Exception("Unexpected error")
+@patch("src.monitor_github_notify.DetectorFactory.create")
+def test_detect_languages_non_english_issue(mock_create, filter_monitor):
+    """Test that non-English issues are detected."""
+    mock_create.return_value.detect.return_value = "fr"
 
-        issue = {
-            "title": "Some issue title with enough text",
-            "body": "Issue body with more text to trigger detection",
-        }
+    assert filter_monitor.detect_languages_bulk(_NON_ENGLISH_ISSUES[1:]) == {222: "fr"}
+    mock_create.return_value.detect.assert_called_once()
 
-        # Should not filter when detection fails
-        self.assertFalse(monitor.is_non_english(issue))
 
-    def test_load_cache_existing(self):
-        """Test loading existing cache file."""
-        cache_data = {"notified_issues": [123, 456, 789]}
+@patch("src.monitor_github_notify.DetectorFactory.create")
+def test_detect_languages_short_text(mock_create, filter_monitor):
+    """Test that very short text is not filtered to avoid false positives."""
+    short_issue = {"id": 1, "title": "Bug", "body": ""}
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
+    assert filter_monitor.detect_languages_bulk([short_issue]) == {}
+    # No detector should be created for short text
+    mock_create.assert_not_called()
 
-        with patch("pathlib.Path.exists", return_value=True), patch(
-            "builtins.open", mock_open(read_data=json.dumps(cache_data))
-        ):
 
-            result = monitor.load_cache()
-            self.assertEqual(result, cache_data)
+@patch("src.monitor_github_notify.DetectorFactory.create")
+def test_detect_languages_generic_exception(mock_create, filter_monitor):
+    """Test handling of generic exceptions in language detection."""
+    mock_create.return_value.detect.side_effect = Exception("Unexpected error")
 
-    def test_load_cache_missing(self):
-        """Test loading cache when file doesn't exist."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
+    # Should not filter when detection fails
+    assert filter_monitor.detect_languages_bulk(_NON_ENGLISH_ISSUES) == {}
 
-        with patch("pathlib.Path.exists", return_value=False):
-            result = monitor.load_cache()
-            self.assertEqual(result, {"notified_issues": []})
 
-    def test_load_cache_invalid_json(self):
-        """Test loading cache with invalid JSON."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
+@patch("src.monitor_github_notify.DetectorFactory.create")
+def test_detect_languages_uses_fasttext_detector(mock_create, filter_monitor):
+    """Test that a loaded fastText model is preferred over langdetect."""
+    filter_monitor._detector = Mock()
+    filter_monitor._detector.predict.return_value = ([("__label__fr",)], [(0.98,)])
 
-        with patch("pathlib.Path.exists", return_value=True), patch(
-            "builtins.open", mock_open(read_data="invalid json")
-        ):
+    issue = {
+        "id": 1,
+        "title": "Problème de sécurité critique",
+        "body": "Ceci est une description\ndétaillée du problème.",
+    }
+
+    assert filter_monitor.detect_languages_bulk([issue]) == {1: "fr"}
+    texts = filter_monitor._detector.predict.call_args[0][0]
+    assert "\n" not in texts[0]
+    mock_create.assert_not_called()
+
+
+def test_detection_sample():
+    """Test which texts are passed on to language detection."""
+    # Short text skips detection
+    assert _detection_sample("Bug", "") is None
 
-            result = monitor.load_cache()
-            self.assertEqual(result, {"notified_issues": []})
+    # Only the first 500 chars of the body are used
+    text = _detection_sample("Проблема с безопасностью", "я" * 1000)
+    assert text == "Проблема с безопасностью " + "я" * 500
 
-    def test_save_cache(self):
-        """Test saving cache to file."""
-        cache_data = {"notified_issues": [123, 456]}
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
+def test_detect_languages_bulk_fasttext(filter_monitor):
+    """Test that bulk detection makes a single batched fastText call."""
+    filter_monitor._detector = Mock()
+    filter_monitor._detector.predict.return_value = (
+        [("__label__en",), ("__label__en",), ("__label__ru",), ("__label__fr",)],
+        [(0.99,), (0.98,), (0.99,), (0.97,)],
+    )
+    short_issue = {"id": 1, "title": "Bug", "body": ""}
+    issues = [*_SAMPLE_ISSUES, short_issue, *_NON_ENGLISH_ISSUES]
 
-        with patch("pathlib.Path.mkdir") as mock_mkdir, patch(
-            "builtins.open", mock_open()
-        ) as mock_file:
+    langs = filter_monitor.detect_languages_bulk(issues)
 
-            monitor.save_cache(cache_data)
+    # Short issues never reach the detector
+    assert langs == {12345: "en", 67890: "en", 111: "ru", 222: "fr"}
+    filter_monitor._detector.predict.assert_called_once()
+    assert len(filter_monitor._detector.predict.call_args[0][0]) == 4
 
-            mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-            mock_file.assert_called_once()
 
-            # Check that json.dump was called with correct data
-            written_content = mock_file().write.call_args_list
-            written_data = "".join(call[0][0] for call in written_content)
-            self.assertIn('"notified_issues"', written_data)
+@patch("src.monitor_github_notify.DetectorFactory.create")
+def test_detect_languages_bulk_langdetect(mock_create, filter_monitor):
+    """Test bulk detection with the langdetect fallback."""
+    from langdetect import LangDetectException
 
-    @patch("src.monitor_github_notify.requests.post")
-    def test_send_slack_notification_success(self, mock_post):
-        """Test successful Slack notification sending."""
-        mock_post.return_value.raise_for_status.return_value = None
+    mock_create.return_value.detect.side_effect = [
+        "ru",
+        LangDetectException("code", "message"),
+    ]
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
+    langs = filter_monitor.detect_languages_bulk(_NON_ENGLISH_ISSUES)
 
-        monitor.send_slack_notification(self.sample_issues)
+    assert langs == {111: "ru"}
 
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
 
-        # Verify webhook URL
-        self.assertEqual(call_args[0][0], "https://hooks.slack.com/test")
+def test_detect_languages_bulk_disabled(monitor):
+    """Test that bulk detection is skipped when filtering is disabled."""
+    assert monitor.detect_languages_bulk(_SAMPLE_ISSUES) == {}
 
-        # Verify payload structure
-        payload = call_args[1]["json"]
-        self.assertIn("blocks", payload)
-        self.assertEqual(payload["username"], "GitHub Monitor")
 
-    @patch("src.monitor_github_notify.requests.post")
-    def test_send_slack_notification_disabled(self, mock_post):
-        """Test Slack notification when disabled."""
-        config = self.test_config.copy()
-        config["notifications"]["slack"]["enabled"] = False
+@patch("src.monitor_github_notify.requests.Session.get")
+def test_load_language_model_downloads_once(mock_get, mock_github_token):
+    """Test that a missing fastText model is downloaded on first detection."""
+    config = {**_TEST_CONFIG, "filterNonEnglish": True}
+    mock_get.return_value.content = b"model-bytes"
+    fake_fasttext = Mock()
+    fake_fasttext.load_model.return_value.predict.return_value = (
+        [("__label__ru",), ("__label__fr",)],
+        [(0.99,), (0.97,)],
+    )
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_path = Path(tmpdir) / "cache" / "lid.176.ftz"
+
+        with patch.dict("sys.modules", {"fasttext": fake_fasttext}), patch(
+            "src.monitor_github_notify.FASTTEXT_MODEL_PATH", model_path
+        ), patch(
+            "src.monitor_github_notify.FASTTEXT_MODEL_SHA256",
+            hashlib.sha256(b"model-bytes").hexdigest(),
+        ):
             monitor = GitHubIssueMonitor(config)
+            # Building a monitor neither downloads nor loads the model
+            mock_get.assert_not_called()
+            fake_fasttext.load_model.assert_not_called()
 
-        monitor.send_slack_notification(self.sample_issues)
-
-        mock_post.assert_not_called()
-
-    @patch("src.monitor_github_notify.requests.post")
-    def test_send_slack_notification_error(self, mock_post):
-        """Test Slack notification error handling."""
-        mock_post.side_effect = requests.exceptions.RequestException("Network error")
-
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
-
-        # Should not raise exception
-        monitor.send_slack_notification(self.sample_issues)
-        mock_post.assert_called_once()
-
-    def test_save_new_issues(self):
-        """Test saving new issues to JSON file."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
-
-        with patch("builtins.open", mock_open()) as mock_file:
-            monitor.save_new_issues(self.sample_issues)
-
-            mock_file.assert_called_once_with("new_issues.json", "w")
-
-            # Verify JSON content was written
-            written_content = mock_file().write.call_args_list
-            written_data = "".join(call[0][0] for call in written_content)
-            self.assertIn('"id": 12345', written_data)
-
-    def test_save_new_issues_empty(self):
-        """Test saving empty issues list."""
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
-
-        with patch("builtins.open", mock_open()) as mock_file:
-            monitor.save_new_issues([])
-
-            # Should not create file for empty list
-            mock_file.assert_not_called()
-
-    @patch("src.monitor_github_notify.Github")
-    def test_search_issues_success(self, mock_github_class):
-        """Test successful issue searching."""
-        # Mock GitHub issue object
-        mock_issue = Mock()
-        mock_issue.id = 12345
-        mock_issue.title = "Test Issue"
-        mock_issue.html_url = "https://github.com/test/repo/issues/1"
-        mock_issue.repository.full_name = "test/repo"
-        mock_issue.user.login = "testuser"
-        mock_issue.created_at = datetime(2024, 1, 15, 14, 30, 0)
-        mock_issue.body = "Test issue body"
-        mock_issue.pull_request = None
-
-        mock_github = Mock()
-        mock_github.search_issues.return_value = [mock_issue]
-        mock_github_class.return_value = mock_github
-
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
-
-        result = monitor.search_issues()
-
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0]["id"], 12345)
-        self.assertEqual(result[0]["title"], "Test Issue")
-        self.assertEqual(result[0]["repository"], "test/repo")
-
-    @patch("src.monitor_github_notify.Github")
-    def test_search_issues_filters_pull_requests(self, mock_github_class):
-        """Test that pull requests are filtered out from search results."""
-        # Mock GitHub issue (should be included)
-        mock_issue = Mock()
-        mock_issue.id = 12345
-        mock_issue.title = "Test Issue"
-        mock_issue.html_url = "https://github.com/test/repo/issues/1"
-        mock_issue.repository.full_name = "test/repo"
-        mock_issue.user.login = "testuser"
-        mock_issue.created_at = datetime(2024, 1, 15, 14, 30, 0)
-        mock_issue.body = "Test issue body"
-        mock_issue.pull_request = None
-
-        # Mock GitHub pull request (should be excluded)
-        mock_pr = Mock()
-        mock_pr.id = 67890
-        mock_pr.title = "Test PR"
-        mock_pr.pull_request = Mock()  # Has pull_request attribute
-
-        mock_github = Mock()
-        mock_github.search_issues.return_value = [mock_issue, mock_pr]
-        mock_github_class.return_value = mock_github
-
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
-
-        result = monitor.search_issues()
-
-        # Should only return the issue, not the PR
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0]["id"], 12345)
-
-    @patch("src.monitor_github_notify.Github")
-    def test_search_issues_api_error(self, mock_github_class):
-        """Test handling of GitHub API errors."""
-        mock_github = Mock()
-        mock_github.search_issues.side_effect = Exception("API Error")
-        mock_github_class.return_value = mock_github
-
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(self.test_config)
-
-        with self.assertRaises(Exception):
-            monitor.search_issues()
-
-
-class TestConfigValidation(unittest.TestCase):
-    """Tests for configuration validation."""
-
-    def test_valid_config(self):
-        """Test that a valid config loads successfully."""
-        config = {
-            "name": "test",
-            "searchPhrases": ["test"],
-            "excludedRepos": [],
-            "excludedOrgs": [],
-            "lookbackHours": 24,
-            "notifications": {
-                "githubIssues": {"enabled": True},
-                "slack": {"enabled": False},
-            },
-        }
+            langs = monitor.detect_languages_bulk(_NON_ENGLISH_ISSUES)
+            monitor.detect_languages_bulk(_NON_ENGLISH_ISSUES)
+            GitHubIssueMonitor(config).detect_languages_bulk(_NON_ENGLISH_ISSUES)
+
+        assert model_path.read_bytes() == b"model-bytes"
+
+    assert langs == {111: "ru", 222: "fr"}
+    mock_get.assert_called_once()
+    # Loaded once per monitor
+    assert fake_fasttext.load_model.call_count == 2
+    fake_fasttext.load_model.assert_called_with(str(model_path))
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
+
+@patch("src.monitor_github_notify.requests.Session.get")
+def test_load_language_model_checksum_mismatch(mock_get, mock_github_token):
+    """Test that a download with the wrong SHA-256 is discarded."""
+    config = {**_TEST_CONFIG, "filterNonEnglish": True}
+    mock_get.return_value.content = b"tampered-bytes"
+    fake_fasttext = Mock()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_path = Path(tmpdir) / "cache" / "lid.176.ftz"
+
+        with patch.dict("sys.modules", {"fasttext": fake_fasttext}), patch(
+            "src.monitor_github_notify.FASTTEXT_MODEL_PATH", model_path
+        ):
             monitor = GitHubIssueMonitor(config)
-            self.assertEqual(monitor.config["name"], "test")
+            monitor.detect_languages_bulk(_NON_ENGLISH_ISSUES)
+
+        assert not model_path.exists()
+        assert not model_path.with_suffix(".tmp").exists()
+
+    fake_fasttext.load_model.assert_not_called()
+    assert monitor._detector is None
+    assert monitor._lang_factory is not None
+
+
+def test_load_language_model_fallback(mock_github_token):
+    """Test that a failed fastText model load falls back to langdetect."""
+    config = {**_TEST_CONFIG, "filterNonEnglish": True}
+
+    with patch.dict("sys.modules", {"fasttext": None}):
+        monitor = GitHubIssueMonitor(config)
+        assert monitor._lang_factory is None
+
+        monitor.detect_languages_bulk(_NON_ENGLISH_ISSUES)
+
+    assert monitor._detector is None
+    assert monitor._lang_factory is not None
+
+
+def test_load_cache_existing(monitor):
+    """Test loading existing cache file."""
+    with patch("pathlib.Path.exists", return_value=True), patch(
+        "builtins.open", mock_open(read_data=_CACHE_JSON)
+    ):
+        result = monitor.load_cache()
+
+    assert result == _CACHE_OBJ
+
+
+@patch("src.monitor_github_notify.time.time", return_value=1705320000)
+def test_load_cache_legacy_list(mock_time, monitor):
+    """Test that a cache with a plain list of IDs is migrated to TTLs."""
+    with patch("pathlib.Path.exists", return_value=True), patch(
+        "builtins.open", mock_open(read_data=_LEGACY_CACHE_JSON)
+    ):
+        result = monitor.load_cache()
+
+    # Expires after twice the 24 hour lookback window plus a day
+    expiry = 1705320000 + 96 * 3600
+    assert result["notified_issues"] == {"123": expiry, "456": expiry}
+
+
+@pytest.mark.parametrize(
+    "watermark",
+    [
+        pytest.param("yesterday", id="not_iso"),
+        pytest.param("2024-01-15T09:30:00", id="no_timezone"),
+        pytest.param(1705310000, id="not_a_string"),
+    ],
+)
+def test_load_cache_drops_invalid_watermark(monitor, watermark):
+    """Test that a malformed last_seen_created_at is dropped on load."""
+    cache = {"notified_issues": {}, "last_seen_created_at": watermark}
+    with patch("pathlib.Path.exists", return_value=True), patch(
+        "builtins.open", mock_open(read_data=json.dumps(cache).encode())
+    ):
+        result = monitor.load_cache()
+
+    assert result == {"notified_issues": {}}
+
+
+def test_load_cache_missing(monitor):
+    """Test loading cache when file doesn't exist."""
+    with patch("pathlib.Path.exists", return_value=False):
+        result = monitor.load_cache()
+        assert result == {"notified_issues": {}}
+
+
+def test_load_cache_invalid_json(monitor):
+    """Test loading cache with invalid JSON."""
+    with patch("pathlib.Path.exists", return_value=True), patch(
+        "builtins.open", mock_open(read_data="invalid json")
+    ):
+
+        result = monitor.load_cache()
+        assert result == {"notified_issues": {}}
+
+
+def test_save_cache(monitor):
+    """Test saving cache to file."""
+    cache_data = {"notified_issues": {"123": 1705330000}}
+
+    buf = io.BytesIO()
+
+    with patch("pathlib.Path.mkdir") as mock_mkdir, patch(
+        "builtins.open", _fake_open(buf)
+    ) as mock_file:
+        monitor.save_cache(cache_data)
+
+    mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+    mock_file.assert_called_once()
+    assert json.loads(buf.getvalue()) == cache_data
+
+
+@patch("src.monitor_github_notify.requests.Session.post")
+def test_send_slack_notification_success(mock_post, monitor):
+    """Test successful Slack notification sending."""
+    mock_post.return_value.raise_for_status.return_value = None
+
+    monitor.send_slack_notification(_SAMPLE_ISSUES)
+
+    mock_post.assert_called_once()
+    call_args = mock_post.call_args
+
+    # Verify webhook URL
+    assert call_args[0][0] == "https://hooks.slack.com/test"
+
+    # Verify payload structure
+    payload = json.loads(call_args[1]["data"])
+    assert "blocks" in payload
+    assert payload["username"] == "GitHub Monitor"
+    assert "📅 2024-01-15 14:30 UTC" in payload["blocks"][3]["text"]["text"]
+
+
+@patch("src.monitor_github_notify.requests.Session.post")
+def test_send_slack_notification_truncates(mock_post, monitor):
+    """Test that at most 10 issues are listed in the Slack message."""
+    issues = [{**_SAMPLE_ISSUES[0], "id": i} for i in range(12)]
+    monitor.send_slack_notification(issues)
+
+    blocks = json.loads(mock_post.call_args[1]["data"])["blocks"]
+    # Header, summary and divider, 10 issues, then the overflow note
+    assert len(blocks) == 14
+    assert blocks[3] == GitHubIssueMonitor._issue_block(issues[0])
+    assert "and 2 more issues" in blocks[-1]["text"]["text"]
+
+
+@patch("src.monitor_github_notify.requests.Session.post")
+def test_send_slack_notification_disabled(mock_post, monitor_slack_disabled):
+    """Test Slack notification when disabled."""
+    monitor_slack_disabled.send_slack_notification(_SAMPLE_ISSUES)
+
+    mock_post.assert_not_called()
+
+
+@patch("src.monitor_github_notify.requests.Session.post")
+def test_send_slack_notification_error(mock_post, monitor):
+    """Test Slack notification error handling."""
+    mock_post.side_effect = requests.exceptions.RequestException("Network error")
+
+    # Should not raise exception
+    monitor.send_slack_notification(_SAMPLE_ISSUES)
+    mock_post.assert_called_once()
+
+
+def test_save_new_issues(monitor):
+    """Test saving new issues to JSON file."""
+    buf = io.BytesIO()
+
+    with patch("builtins.open", _fake_open(buf)) as mock_file:
+        monitor.save_new_issues([dict(issue) for issue in _SAMPLE_ISSUES])
+
+    mock_file.assert_called_once_with("new_issues.json", "wb")
+    assert json.loads(buf.getvalue()) == list(_SAMPLE_ISSUES)
+
+
+def test_save_new_issues_empty(monitor):
+    """Test saving empty issues list."""
+    with patch("builtins.open", mock_open()) as mock_file:
+        monitor.save_new_issues([])
+
+        # Should not create file for empty list
+        mock_file.assert_not_called()
+
+
+@patch("src.monitor_github_notify.requests.Session.get")
+def test_search_issues_success(mock_get, monitor, github_search_item):
+    """Test successful issue searching."""
+    mock_get.return_value = _search_response(github_search_item)
+
+    result = monitor.search_issues()
+
+    assert len(result) == 1
+    assert result[0]["id"] == 12345
+    assert result[0]["title"] == "Test Issue"
+    assert result[0]["repository"] == "test/repo"
+    assert result[0]["user"] == "testuser"
+
+    # Token is sent as a request header, not on the shared session
+    headers = mock_get.call_args[1]["headers"]
+    assert headers["Authorization"] == "token fake_token"
 
-    def test_missing_required_fields(self):
-        """Test behavior with missing required configuration fields."""
-        incomplete_config = {"name": "test"}
 
-        with patch.dict(os.environ, {"GITHUB_TOKEN": "fake_token"}):
-            monitor = GitHubIssueMonitor(incomplete_config)
+@patch("src.monitor_github_notify.requests.Session.get")
+def test_search_issues_filters_pull_requests(mock_get, monitor, github_search_item):
+    """Test that pull requests are filtered out from search results."""
+    # GitHub issue (should be included)
+    issue_item = {**github_search_item, "body": None}
 
-            # Should raise KeyError for missing required fields
-            with self.assertRaises(KeyError):
-                monitor.build_search_query()
+    # GitHub pull request (should be excluded)
+    pr_item = {
+        **issue_item,
+        "id": 67890,
+        "title": "Test PR",
+        "pull_request": {"url": "https://api.github.com/repos/test/repo/pulls/2"},
+    }
+    mock_get.return_value = _search_response(issue_item, pr_item)
 
+    result = monitor.search_issues()
 
-if __name__ == "__main__":
-    unittest.main()
+    # Should only return the issue, not the PR
+    assert len(result) == 1
+    assert result[0]["id"] == 12345
+    assert result[0]["body"] == ""
+
+
+@patch("src.monitor_github_notify.requests.Session.get")
+def test_search_issues_fetches_all_pages(mock_get, monitor):
+    """Test that every result page is fetched, up to the search limit."""
+    mock_get.return_value = _search_response(total_count=250)
+
+    monitor.search_issues()
+
+    pages = sorted(call[1]["params"]["page"] for call in mock_get.call_args_list)
+    assert pages == [1, 2, 3]
+
+
+@patch("src.monitor_github_notify.requests.Session.get")
+def test_search_issues_api_error(mock_get, monitor):
+    """Test handling of GitHub API errors."""
+    mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        "API Error"
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        monitor.search_issues()
+
+
+@patch("src.monitor_github_notify.time.sleep")
+@patch("src.monitor_github_notify.time.time", return_value=1705330000)
+@patch("src.monitor_github_notify.requests.Session.get")
+def test_search_issues_waits_for_rate_limit_reset(
+    mock_get, mock_time, mock_sleep, monitor, github_search_item
+):
+    """Test that a primary rate limit waits for the reset, then retries."""
+    rate_limited = Mock(
+        status_code=403,
+        headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1705330030"},
+    )
+    mock_get.side_effect = [rate_limited, _search_response(github_search_item)]
+
+    result = monitor.search_issues()
+
+    mock_sleep.assert_called_once_with(31)
+    assert [issue["id"] for issue in result] == [12345]
+
+
+@patch("src.monitor_github_notify.time.sleep")
+@patch("src.monitor_github_notify.requests.Session.get")
+def test_search_issues_forbidden_not_retried(mock_get, mock_sleep, monitor):
+    """Test that a 403 that is not a rate limit fails without retrying."""
+    mock_get.return_value = Mock(status_code=403, headers={})
+    mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        "403 Forbidden"
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        monitor.search_issues()
+
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "lookback,expected",
+    [
+        pytest.param(
+            24,
+            [
+                '("security vulnerability" OR "critical bug")',
+                "type:issue",
+                "created:>=2024-01-14",
+            ],
+            id="basic",
+        ),
+        pytest.param(
+            24,
+            [
+                "-repo:spam/repo",
+                "-repo:test/exclude",
+                "-org:spamorg",
+                "-org:excludeorg",
+            ],
+            id="exclusions",
+        ),
+        pytest.param(48, ["created:>=2024-01-13"], id="custom_lookback"),
+    ],
+)
+def test_build_search_query(frozen_now, mock_github_token, lookback, expected):
+    """Test search query construction from the configuration."""
+    monitor = GitHubIssueMonitor({**_TEST_CONFIG, "lookbackHours": lookback})
+
+    query = monitor.build_search_query()
+
+    assert all(term in query for term in expected), query
+    frozen_now.now.assert_called_once_with(timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "since,expected",
+    [
+        # Starts an hour early to catch issues indexed late
+        pytest.param(
+            "2024-01-15T09:30:00Z", "created:>=2024-01-15T08:30:00Z", id="recent"
+        ),
+        # Older than the lookback window: fall back to lookbackHours
+        pytest.param("2024-01-10T09:30:00Z", "created:>=2024-01-14", id="stale"),
+    ],
+)
+def test_build_search_query_since_last_seen(frozen_now, monitor, since, expected):
+    """Test that the query starts from the newest issue already seen."""
+    assert expected in monitor.build_search_query(since)
+
+
+def test_valid_config(mock_github_token):
+    """Test that a valid config loads successfully."""
+    config = {
+        "name": "test",
+        "searchPhrases": ["test"],
+        "excludedRepos": [],
+        "excludedOrgs": [],
+        "lookbackHours": 24,
+        "notifications": {
+            "githubIssues": {"enabled": True},
+            "slack": {"enabled": False},
+        },
+    }
+
+    monitor = GitHubIssueMonitor(config)
+    assert monitor.config["name"] == "test"
+
+
+def test_missing_required_fields(mock_github_token):
+    """Test behavior with missing required configuration fields."""
+    incomplete_config = {"name": "test"}
+
+    monitor = GitHubIssueMonitor(incomplete_config)
+
+    # Should raise KeyError for missing required fields
+    with pytest.raises(KeyError):
+        monitor.build_search_query()